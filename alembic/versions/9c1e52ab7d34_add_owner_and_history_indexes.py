@@ -0,0 +1,39 @@
+"""Add owner and history indexes
+
+Revision ID: 9c1e52ab7d34
+Revises: 4d4f87b1027f
+Create Date: 2026-08-29 10:12:44.501284
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "9c1e52ab7d34"
+down_revision: Union[str, None] = "4d4f87b1027f"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index(
+        "ix_resumes_owner_id_id",
+        "resumes",
+        ["owner_id", "id"],
+    )
+    op.create_index(
+        "ix_resume_history_resume_id_timestamp",
+        "resume_history",
+        ["resume_id", "timestamp"],
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index(
+        "ix_resume_history_resume_id_timestamp", table_name="resume_history"
+    )
+    op.drop_index("ix_resumes_owner_id_id", table_name="resumes")
@@ -0,0 +1,39 @@
+"""Require changed content in history
+
+Revision ID: d7f05b318c92
+Revises: 9c1e52ab7d34
+Create Date: 2026-08-29 11:03:17.296415
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "d7f05b318c92"
+down_revision: Union[str, None] = "9c1e52ab7d34"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.execute(
+        "DELETE FROM resume_history "
+        "WHERE original_content = improved_content"
+    )
+    op.create_check_constraint(
+        "ck_resume_history_content_changed",
+        "resume_history",
+        "original_content <> improved_content",
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_constraint(
+        "ck_resume_history_content_changed",
+        "resume_history",
+        type_="check",
+    )
@@ -7,15 +7,18 @@ with SQLAlchemy for database interactions and authentication for
 securing the endpoints.
 """
 
-from typing import List
+from typing import AsyncIterator, List, Optional
 
 from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi.responses import StreamingResponse
 from loguru import logger
+from sqlalchemy.ext.asyncio import AsyncSession
 
 from .... import schemas
 from ....dao import ResumeDAO
+from ....database import async_session, get_session
 from ....security import get_current_user
-from ....services import ai_service
+from ....services import ai_batcher
 
 router = APIRouter()
 
@@ -23,35 +26,42 @@ router = APIRouter()
 @router.post(
     "/",
     status_code=status.HTTP_201_CREATED,
+    response_model=schemas.Resume,
     summary="Create a new resume",
     description="Creates a new resume in the system. Requires authentication.",
 )
 async def create_resume(
     resume: schemas.ResumeCreate,
     current_user: schemas.User = Depends(get_current_user),
-) -> schemas.Resume:
+    session: AsyncSession = Depends(get_session),
+):
     """
     Create a new resume.
 
     Args:
         resume (schemas.ResumeCreate): The resume to create.
         current_user (schemas.User): The current user.
+        session (AsyncSession): The request-scoped database session.
 
     Returns:
         schemas.Resume: The created resume.
     """
     logger.info("Received request to create a resume.")
 
-    data = resume.model_dump()
-    data["owner_id"] = current_user.id
+    data = {
+        **resume.model_dump(exclude_unset=True),
+        "owner_id": current_user.id,
+    }
 
-    new_db_resume = await ResumeDAO.create_record(data)
+    new_db_resume = await ResumeDAO.create_record(session, data)
+    await session.commit()
 
-    return schemas.Resume.model_validate(new_db_resume)
+    return new_db_resume
 
 
 @router.get(
     "/{resume_id}",
+    response_model=schemas.Resume,
     summary="Get resume by ID",
     description="Retrieves a specific resume by its ID. "
     "Requires authentication.",
@@ -59,7 +69,8 @@ async def create_resume(
 async def read_resume(
     resume_id: int,
     current_user: schemas.User = Depends(get_current_user),
-) -> schemas.Resume:
+    session: AsyncSession = Depends(get_session),
+):
     """
     Get resume by ID.
 
@@ -77,17 +88,16 @@ async def read_resume(
     logger.info("Received request to get a resume by id.")
 
     filter_by = {"id": resume_id, "owner_id": current_user.id}
-    resume = await ResumeDAO.get_records_or_record(
-        return_one=True, **filter_by
-    )
+    resume = await ResumeDAO.get_one(session, **filter_by)
     if resume is None:
         raise HTTPException(status_code=404, detail="Resume not found")
 
-    return schemas.Resume.model_validate(resume)
+    return resume
 
 
 @router.get(
     "/",
+    response_model=List[schemas.Resume],
     summary="Get all user's resumes",
     description="Retrieves a list of user's resumes. "
     "Supports pagination with skip and limit parameters. "
@@ -96,15 +106,23 @@ async def read_resume(
 async def read_resumes(
     skip: int = 0,
     limit: int = 100,
+    after_id: Optional[int] = None,
     current_user: schemas.User = Depends(get_current_user),
-) -> List[schemas.Resume]:
+):
     """
     Get all resumes.
 
+    The response body is streamed: each resume is serialized and sent
+    as soon as it arrives from the database, so the page is never held
+    in memory as a whole. For the next page, pass the ID of the last
+    resume in the body as `after_id`.
+
     Args:
         skip (int, optional): The number of resumes to skip. Defaults to 0.
         limit (int, optional): The maximum number of resumes to return.
                                 Defaults to 100.
+        after_id (int, optional): Keyset cursor; return resumes with an ID
+                                greater than this value, in ID order.
         current_user (schemas.User): The current user.
 
     Returns:
@@ -112,20 +130,35 @@ async def read_resumes(
     """
     logger.info("Received request to get all resumes of user.")
 
-    filter_by = {"owner_id": current_user.id}
-    resumes = await ResumeDAO.get_records_or_record(
-        return_one=False, skip=skip, limit=limit, **filter_by
-    )
-    if resumes is None:
-        return []
-
-    if isinstance(resumes, list):
-        return [schemas.Resume.model_validate(resume) for resume in resumes]
-    return [schemas.Resume.model_validate(resumes)]
+    owner_id = current_user.id
+
+    async def render() -> AsyncIterator[bytes]:
+        # The request-scoped session from get_session is torn down
+        # before the response body runs, which would close the
+        # server-side cursor mid-stream; this generator owns a session
+        # spanning the whole body instead.
+        async with async_session() as session:
+            rows = await ResumeDAO.stream_many(
+                session,
+                skip=skip,
+                limit=limit,
+                cursor=after_id,
+                owner_id=owner_id,
+            )
+            first = True
+            async for row in rows:
+                yield (
+                    b"[" if first else b","
+                ) + schemas.Resume.model_validate(row).model_dump_json().encode()
+                first = False
+            yield b"[]" if first else b"]"
+
+    return StreamingResponse(render(), media_type="application/json")
 
 
 @router.put(
     "/{resume_id}",
+    response_model=schemas.Resume,
     summary="Update resume",
     description="Updates an existing resume by its ID. "
     "Requires authentication to modify the resume.",
@@ -134,7 +167,8 @@ async def update_resume(
     resume_id: int,
     resume: schemas.ResumeUpdate,
     current_user: schemas.User = Depends(get_current_user),
-) -> schemas.Resume:
+    session: AsyncSession = Depends(get_session),
+):
     """
     Update resume.
 
@@ -153,14 +187,7 @@ async def update_resume(
     """
     logger.info("Received request to update a resume.")
 
-    def valid_value(key_value):
-        _, value = key_value
-        return (
-            isinstance(value, str) and not value.isspace() and len(value) > 0
-        )
-
-    update_data = resume.model_dump()
-    update_data = dict(filter(valid_value, update_data.items()))
+    update_data = resume.model_dump(exclude_unset=True, exclude_none=True)
 
     if len(update_data) == 0:
         raise HTTPException(
@@ -169,12 +196,16 @@ async def update_resume(
         )
 
     updated_resume = await ResumeDAO.update_record(
-        obj_id=resume_id, obj_data=update_data, owner_id=current_user.id
+        session,
+        obj_id=resume_id,
+        obj_data=update_data,
+        owner_id=current_user.id,
     )
     if updated_resume is None:
         raise HTTPException(status_code=404, detail="Resume not found")
+    await session.commit()
 
-    return schemas.Resume.model_validate(updated_resume)
+    return updated_resume
 
 
 @router.delete(
@@ -187,6 +218,7 @@ async def update_resume(
 async def delete_resume(
     resume_id: int,
     current_user: schemas.User = Depends(get_current_user),
+    session: AsyncSession = Depends(get_session),
 ) -> None:
     """
     Delete resume.
@@ -205,17 +237,23 @@ async def delete_resume(
     logger.info("Received request to delete a resume.")
 
     resume = await ResumeDAO.delete_record(
-        obj_id=resume_id, owner_id=current_user.id
+        session, obj_id=resume_id, owner_id=current_user.id
     )
     if resume is None:
         raise HTTPException(status_code=404, detail="Resume not found")
+    await session.commit()
 
 
-@router.post("/resume/{resume_id}/improve", tags=["AI"])
+@router.post(
+    "/resume/{resume_id}/improve",
+    response_model=schemas.Resume,
+    tags=["AI"],
+)
 async def improve_resume(
     resume_id: int,
     current_user: schemas.User = Depends(get_current_user),
-) -> schemas.Resume:
+    session: AsyncSession = Depends(get_session),
+):
     """
     Improve resume content.
 
@@ -233,9 +271,7 @@ async def improve_resume(
     logger.info("Received request to improve a resume's content.")
 
     filter_by = {"id": resume_id, "owner_id": current_user.id}
-    resume = await ResumeDAO.get_records_or_record(
-        return_one=True, **filter_by
-    )
+    resume = await ResumeDAO.get_one(session, **filter_by)
     if resume is None:
         raise HTTPException(status_code=404, detail="Resume not found")
 
@@ -243,9 +279,7 @@ async def improve_resume(
     if original_content is None:
         raise HTTPException(status_code=404, detail="Content not found")
 
-    ai_result_text = await ai_service.improve_resume_content(
-        original_content=original_content
-    )
+    ai_result_text = await ai_batcher.improve(original_content)
 
     data_update = {
         "content": ai_result_text,
@@ -253,10 +287,12 @@ async def improve_resume(
     }
 
     resume = await ResumeDAO.update_record(
+        session,
         obj_id=resume_id,
         obj_data=data_update,
         owner_id=current_user.id,
         use_history=True,
     )
+    await session.commit()
 
-    return schemas.Resume.model_validate(resume)
+    return resume
@@ -6,20 +6,22 @@ It utilizes FastAPI's routing and dependency injection features, along
 with SQLAlchemy for database interactions.
 """
 
-from typing import List
+from typing import List, Optional
 
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Response, status
 from fastapi.security import OAuth2PasswordRequestForm
 from loguru import logger
+from sqlalchemy.ext.asyncio import AsyncSession
 
 from .... import schemas
 from ....dao import UserDAO
-from ....models import DBUser
+from ....database import get_session
 from ....security import (
     create_access_token,
     get_current_user,
-    hash_password,
-    verify_password,
+    hash_password_async,
+    invalidate_user_cache,
+    verify_password_async,
 )
 
 router = APIRouter()
@@ -28,16 +30,21 @@ router = APIRouter()
 @router.post(
     "/",
     status_code=status.HTTP_201_CREATED,
+    response_model=schemas.User,
     summary="Create a new user",
     description="Registers a new user in the system. "
     "Requires a unique username and email.",
 )
-async def create_user(user: schemas.UserCreate) -> schemas.User:
+async def create_user(
+    user: schemas.UserCreate,
+    session: AsyncSession = Depends(get_session),
+):
     """
     Create a new user.
 
     Args:
         user (schemas.UserCreate): The user to create.
+        session (AsyncSession): The request-scoped database session.
 
     Returns:
         schemas.User: The created user.
@@ -47,25 +54,29 @@ async def create_user(user: schemas.UserCreate) -> schemas.User:
     """
     logger.info("Received request to register new user.")
 
-    data = user.model_dump()
-    data["hashed_password"] = hash_password(user.password)
-    del data["password"]
-    new_db_user = await UserDAO.create_record(data)
+    data = user.model_dump(exclude={"password"})
+    data["hashed_password"] = await hash_password_async(user.password)
+    new_db_user = await UserDAO.create_record(session, data)
     if not new_db_user:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="Username or email already registered",
         )
+    await session.commit()
 
-    return schemas.User.model_validate(new_db_user)
+    return new_db_user
 
 
 @router.get(
     "/{user_id}",
+    response_model=schemas.User,
     summary="Get user by ID",
     description="Retrieves a specific user by ID.",
 )
-async def read_user(user_id: int) -> schemas.User:
+async def read_user(
+    user_id: int,
+    session: AsyncSession = Depends(get_session),
+):
     """
     Get user by ID.
 
@@ -80,26 +91,28 @@ async def read_user(user_id: int) -> schemas.User:
     """
     logger.info("Received request to get a user by id.")
 
-    exist_user = await UserDAO.get_records_or_record(
-        return_one=True, id=user_id
-    )
+    exist_user = await UserDAO.get_one(session, id=user_id)
     if exist_user is None:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND, detail="User not found"
         )
-    return schemas.User.model_validate(exist_user)
+    return exist_user
 
 
 @router.get(
     "/",
+    response_model=List[schemas.User],
     summary="Get all users",
     description="Retrieves a list of all users. "
     "Supports pagination with skip and limit parameters.",
 )
 async def read_users(
+    response: Response,
     skip: int = 0,
     limit: int = 100,
-) -> List[schemas.User]:
+    after_id: Optional[int] = None,
+    session: AsyncSession = Depends(get_session),
+):
     """
     Get all users.
 
@@ -107,22 +120,28 @@ async def read_users(
         skip (int, optional): The number of users to skip. Defaults to 0.
         limit (int, optional): The maximum number of users to return.
                                 Defaults to 100.
+        after_id (int, optional): Keyset cursor; return users with an ID
+                                greater than this value. The ID to pass for
+                                the next page is sent back in the
+                                X-Next-Cursor header.
 
     Returns:
         List[schemas.User]: A list of users.
     """
     logger.info("Received request to get all users.")
 
-    users = await UserDAO.get_records_or_record(skip=skip, limit=limit)
-    if not users:
-        return []
-    if isinstance(users, list):
-        return [schemas.User.model_validate(user) for user in users]
-    return [schemas.User.model_validate(users)]
+    users = await UserDAO.get_many(
+        session, skip=skip, limit=limit, cursor=after_id
+    )
+    if users:
+        response.headers["X-Next-Cursor"] = str(users[-1].id)
+
+    return users
 
 
 @router.put(
     "/{user_id}",
+    response_model=schemas.User,
     summary="Update user information",
     description="Updates an existing user by ID.",
 )
@@ -130,7 +149,8 @@ async def update_user(
     user_id: int,
     user: schemas.UserUpdate,
     current_user: schemas.User = Depends(get_current_user),
-) -> schemas.User:
+    session: AsyncSession = Depends(get_session),
+):
     """
     Update user.
 
@@ -147,19 +167,12 @@ async def update_user(
     """
     logger.info("Received request to update a user.")
 
-    def valid_value(key_value):
-        _, value = key_value
-        return (
-            isinstance(value, str) and not value.isspace() and len(value) > 0
-        )
-
     if current_user.id != user_id:
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN,
         )
 
-    update_data = user.model_dump()
-    update_data = dict(filter(valid_value, update_data.items()))
+    update_data = user.model_dump(exclude_unset=True, exclude_none=True)
 
     if len(update_data) == 0:
         raise HTTPException(
@@ -168,14 +181,16 @@ async def update_user(
         )
 
     updated_user = await UserDAO.update_record(
-        obj_id=user_id, obj_data=update_data
+        session, obj_id=user_id, obj_data=update_data
     )
     if updated_user is None:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND, detail="User not found"
         )
+    await session.commit()
+    invalidate_user_cache(user_id)
 
-    return schemas.User.model_validate(updated_user)
+    return updated_user
 
 
 @router.delete(
@@ -185,7 +200,9 @@ async def update_user(
     description="Deletes a user by ID.",
 )
 async def delete_user(
-    user_id: int, current_user: schemas.User = Depends(get_current_user)
+    user_id: int,
+    current_user: schemas.User = Depends(get_current_user),
+    session: AsyncSession = Depends(get_session),
 ) -> None:
     """
     Delete user.
@@ -204,11 +221,13 @@ async def delete_user(
             status_code=status.HTTP_403_FORBIDDEN,
         )
 
-    deleted_id = await UserDAO.delete_record(obj_id=user_id)
+    deleted_id = await UserDAO.delete_record(session, obj_id=user_id)
     if deleted_id is None:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND, detail="User not found"
         )
+    await session.commit()
+    invalidate_user_cache(user_id)
 
 
 @router.post(
@@ -219,6 +238,7 @@ async def delete_user(
 )
 async def login_for_access_token(
     form_data: OAuth2PasswordRequestForm = Depends(),
+    session: AsyncSession = Depends(get_session),
 ) -> schemas.Token:
     """
     Endpoint for generating access tokens.
@@ -237,10 +257,8 @@ async def login_for_access_token(
         f"Received request to get token for user {form_data.username}."
     )
 
-    db_user = await UserDAO.get_records_or_record(
-        True, username=form_data.username
-    )
-    if not isinstance(db_user, DBUser) or not verify_password(
+    db_user = await UserDAO.get_by_username(session, form_data.username)
+    if db_user is None or not await verify_password_async(
         plain_password=form_data.password,
         hashed_password=db_user.hashed_password,
     ):
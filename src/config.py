@@ -19,6 +19,13 @@ class Settings(BaseSettings):
     db_port: str = "5432"
     db_name: str = "resumes"
     db_dialect_async: str = "postgresql+asyncpg"
+    db_pool_size: int = 20
+    db_max_overflow: int = 40
+    db_pool_timeout: int = 30
+    db_pool_recycle: int = 3600
+    db_prepared_statement_cache_size: int = 250
+    use_pgbouncer: bool = False
+    bcrypt_rounds: int = 12
     secret_key: str = "your-secret-key"
     algorithm: str = "HS256"
     access_token_expire_minutes: int = 30
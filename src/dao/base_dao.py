@@ -8,9 +8,9 @@ on specific models.
 from typing import Any, Generic, List, Optional, TypeVar
 
 from loguru import logger
-from sqlalchemy import delete, insert, select, update
+from sqlalchemy import delete, insert, lambda_stmt, select, update
+from sqlalchemy.ext.asyncio import AsyncSession
 
-from ..database import async_session
 from ..models import Base
 
 T = TypeVar("T", bound=Base)
@@ -21,121 +21,175 @@ class BaseDAO(Generic[T]):
     Base Data Access Object (DAO) for interacting with the database.
 
     This class provides a set of methods to perform CRUD operations on the
-    specified model.
+    specified model. All methods operate on a caller-provided session, so
+    one HTTP request shares a single session (and transaction) across all
+    of its DAO calls; committing is the caller's responsibility.
 
     Attributes:
         model (Any): The SQLAlchemy model that this DAO is associated with.
     """
 
     model: Any = None
+    _insert_stmt: Any = None
+
+    def __init_subclass__(cls, **kwargs) -> None:
+        """
+        Build the statement templates shared by all calls once per
+        subclass, so SQLAlchemy's compiled-statement cache is hit by
+        the same object instead of a per-call construction.
+        """
+        super().__init_subclass__(**kwargs)
+        if cls.model is not None:
+            cls._insert_stmt = insert(cls.model).returning(cls.model)
+
+    @classmethod
+    async def get_one(
+        cls, session: AsyncSession, **filter_by
+    ) -> Optional[T]:
+        """
+        Retrieve a single record from the database based on the provided
+        filters.
+
+        Args:
+            session (AsyncSession): The session to run the query on.
+            filter_by (dict): The filter conditions to apply to the query.
+
+        Returns:
+            The retrieved record, or None if no record matched.
+        """
+        logger.opt(lazy=True).debug(
+            "Starting get one for model {model}",
+            model=lambda: cls.model.__name__,
+        )
+
+        query = select(cls.model).filter_by(**filter_by)
+        result = await session.execute(query)
+        return result.scalar_one_or_none()
 
     @classmethod
-    async def get_records_or_record(
+    async def get_many(
         cls,
-        return_one: bool = False,
+        session: AsyncSession,
         skip: int = 0,
         limit: int = 100,
+        cursor: Optional[int] = None,
         **filter_by,
-    ) -> Optional[T | List[T]]:
+    ) -> List[T]:
         """
-        Retrieve a single record or all records from the database
-        based on the provided filters.
+        Retrieve records from the database based on the provided filters.
 
         Args:
-            return_one (bool): If True, returns a single record; otherwise,
-                                returns all records.
+            session (AsyncSession): The session to run the query on.
+            skip (int): Offset for the legacy pagination mode; scanning
+                        cost grows with the offset, prefer `cursor`.
+            cursor (int): Keyset pagination - return records with an ID
+                          greater than this value, in ID order.
             filter_by (dict): The filter conditions to apply to the query.
 
         Returns:
-            The retrieved record(s) as a single object if `return_one` is True,
-            or as a list of objects if `return_one` is False.
+            The retrieved records as a list, empty if none matched.
         """
-        logger.debug(
-            "Starting get records or record for model {model.__name__}"
+        logger.opt(lazy=True).debug(
+            "Starting get many for model {model}",
+            model=lambda: cls.model.__name__,
         )
 
-        async with async_session() as session:
+        if cursor is not None:
             query = (
                 select(cls.model)
                 .filter_by(**filter_by)
+                .where(cls.model.id > cursor)
+                .order_by(cls.model.id)
+                .limit(limit)
+            )
+        else:
+            if skip:
+                logger.warning(
+                    "Offset pagination (skip) is deprecated; "
+                    "use cursor instead."
+                )
+            query = (
+                select(cls.model)
+                .filter_by(**filter_by)
+                .order_by(cls.model.id)
                 .offset(skip)
                 .limit(limit)
             )
-            result = await session.execute(query)
-
-            if return_one:
-                return result.scalar_one_or_none()
-            return list(result.scalars().all())
+        result = await session.execute(query)
+        return list(result.scalars().all())
 
     @classmethod
-    async def create_record(cls, obj_data: dict[str, Any]) -> T:
+    async def create_record(
+        cls, session: AsyncSession, obj_data: dict[str, Any]
+    ) -> T:
         """
         Create a new record in the database.
 
         Args:
+            session (AsyncSession): The session to run the query on.
             obj_data (dict): The data for creating a new record.
 
         Returns:
             The created record.
         """
-        logger.debug(
-            "Starting create record for model {model.__name__}"
+        logger.opt(lazy=True).debug(
+            "Starting create record for model {model}",
+            model=lambda: cls.model.__name__,
         )
 
-        async with async_session() as session:
-            query = insert(cls.model).values(**obj_data).returning(cls.model)
-            result = await session.execute(query)
-            await session.commit()
-            return result.scalar_one()
+        query = cls._insert_stmt.values(**obj_data)
+        result = await session.execute(query)
+        return result.scalar_one()
 
     @classmethod
     async def update_record(
-        cls, obj_id: int, obj_data: dict[str, Any]
+        cls, session: AsyncSession, obj_id: int, obj_data: dict[str, Any]
     ) -> Optional[T]:
         """
         Update an existing record in the database.
 
         Args:
+            session (AsyncSession): The session to run the query on.
             obj_id (int): The ID of the record to update.
             obj_data (dict): The data for updating the record.
 
         Returns:
             The updated record or None if not found.
         """
-        logger.debug(
-            "Starting update record for model {model.__name__}"
+        logger.opt(lazy=True).debug(
+            "Starting update record for model {model}",
+            model=lambda: cls.model.__name__,
         )
 
-        async with async_session() as session:
-            query = (
-                update(cls.model)
-                .where(cls.model.id == obj_id)
-                .values(**obj_data)
-                .returning(cls.model)
-            )
-            result = await session.execute(query)
-            await session.commit()
-            return result.scalar_one_or_none()
+        query = (
+            update(cls.model)
+            .where(cls.model.id == obj_id)
+            .values(**obj_data)
+            .returning(cls.model)
+        )
+        result = await session.execute(query)
+        return result.scalar_one_or_none()
 
     @classmethod
-    async def delete_record(cls, obj_id: int) -> int | None:
+    async def delete_record(
+        cls, session: AsyncSession, obj_id: int
+    ) -> int | None:
         """
         Delete a record from the database.
 
         Args:
+            session (AsyncSession): The session to run the query on.
             obj_id (int): The ID of the record to delete.
+
+        Returns:
+            The deleted record's ID, or None if no row matched.
         """
-        logger.debug(
-            "Starting delete record for model {model.__name__}"
+        logger.opt(lazy=True).debug(
+            "Starting delete record for model {model}",
+            model=lambda: cls.model.__name__,
         )
 
-        async with async_session() as session:
-            query = (
-                delete(cls.model)
-                .where(cls.model.id == obj_id)
-                .returning(cls.model.id)
-            )
-            result = await session.execute(query)
-            deleted_id = result.scalar_one_or_none()
-            await session.commit()
-            return deleted_id
+        model = cls.model
+        query = lambda_stmt(lambda: delete(model).where(model.id == obj_id))
+        result = await session.execute(query)
+        return obj_id if result.rowcount else None
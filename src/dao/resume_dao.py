@@ -3,12 +3,12 @@ Resume Data Access Object (DAO) module for interacting with resume data in the
 database.
 """
 
-from typing import Optional
+from typing import AsyncIterator, Optional
 
 from loguru import logger
-from sqlalchemy import delete, insert, update
+from sqlalchemy import delete, insert, lambda_stmt, select, update
+from sqlalchemy.ext.asyncio import AsyncSession
 
-from ..database import async_session
 from ..models import DBResume, DBResumeHistory
 from .base_dao import BaseDAO
 
@@ -21,9 +21,67 @@ class ResumeDAO(BaseDAO[DBResume]):
 
     model = DBResume
 
+    @classmethod
+    async def stream_many(
+        cls,
+        session: AsyncSession,
+        skip: int = 0,
+        limit: int = 100,
+        cursor: Optional[int] = None,
+        **filter_by,
+    ) -> AsyncIterator[DBResume]:
+        """
+        Stream records from the database based on the provided filters.
+
+        Unlike get_many, rows are fetched from the server in blocks and
+        yielded one at a time, so memory stays flat no matter how large
+        the page is.
+
+        Args:
+            session (AsyncSession): The session to run the query on.
+            skip (int): Offset for the legacy pagination mode; scanning
+                        cost grows with the offset, prefer `cursor`.
+            cursor (int): Keyset pagination - return records with an ID
+                          greater than this value, in ID order.
+            filter_by (dict): The filter conditions to apply to the query.
+
+        Returns:
+            An async iterator over the matching records.
+        """
+        logger.opt(lazy=True).debug(
+            "Starting stream many for model {model}",
+            model=lambda: cls.model.__name__,
+        )
+
+        if cursor is not None:
+            query = (
+                select(cls.model)
+                .filter_by(**filter_by)
+                .where(cls.model.id > cursor)
+                .order_by(cls.model.id)
+                .limit(limit)
+            )
+        else:
+            if skip:
+                logger.warning(
+                    "Offset pagination (skip) is deprecated; "
+                    "use cursor instead."
+                )
+            query = (
+                select(cls.model)
+                .filter_by(**filter_by)
+                .order_by(cls.model.id)
+                .offset(skip)
+                .limit(limit)
+            )
+        return await session.stream_scalars(
+            query.execution_options(yield_per=500)
+        )
+
     @classmethod
     async def update_record(
         cls,
+        session: AsyncSession,
         obj_id: int,
         obj_data: dict[str, str],
         owner_id: Optional[int] = None,
@@ -33,6 +91,7 @@ class ResumeDAO(BaseDAO[DBResume]):
         Update an existing resume in the database.
 
         Args:
+            session (AsyncSession): The session to run the query on.
             obj_id (int): The ID of the record to update.
             obj_data (dict): The data for updating the record.
             owner_id (int): The ID of the record's owner to update.
@@ -41,60 +100,78 @@ class ResumeDAO(BaseDAO[DBResume]):
         Returns:
             The updated record or None if not found.
         """
-        logger.debug("Starting update record for model {model.__name__}")
-
-        async with async_session() as session:
-            if (
-                use_history
-                and "content" in obj_data
-                and "original_content" in obj_data
-            ):
-                logger.debug(
-                    "Starting log improved content "
-                    "for model {DBResumeHistory.__name__}"
-                )
-                improved_content_to_log = obj_data.get("content")
-                original_content_for_log = obj_data.get("original_content")
+        logger.opt(lazy=True).debug(
+            "Starting update record for model {model}",
+            model=lambda: cls.model.__name__,
+        )
+
+        resume_values = {
+            key: value
+            for key, value in obj_data.items()
+            if key != "original_content"
+        }
+
+        query = (
+            update(cls.model)
+            .where(cls.model.id == obj_id)
+            .where(cls.model.owner_id == owner_id)
+            .values(**resume_values)
+            .returning(cls.model)
+        )
 
-                history_query = insert(DBResumeHistory).values(
+        if (
+            use_history
+            and "content" in obj_data
+            and "original_content" in obj_data
+            # A no-op improvement carries no information; don't let it
+            # bloat the history table.
+            and obj_data["content"] != obj_data["original_content"]
+        ):
+            logger.opt(lazy=True).debug(
+                "Starting log improved content for model {model}",
+                model=lambda: DBResumeHistory.__name__,
+            )
+            history_cte = (
+                insert(DBResumeHistory)
+                .values(
                     resume_id=obj_id,
-                    original_content=original_content_for_log,
-                    improved_content=improved_content_to_log,
+                    original_content=obj_data["original_content"],
+                    improved_content=obj_data["content"],
                 )
-                await session.execute(history_query)
-                del obj_data["original_content"]
-
-            query = (
-                update(cls.model)
-                .where(cls.model.id == obj_id)
-                .where(cls.model.owner_id == owner_id)
-                .values(**obj_data)
-                .returning(cls.model)
+                .cte("hist")
             )
-            result = await session.execute(query)
-            await session.commit()
-            return result.scalar_one_or_none()
+            query = query.add_cte(history_cte)
+
+        result = await session.execute(query)
+        return result.scalar_one_or_none()
 
     @classmethod
     async def delete_record(
-        cls, obj_id: int, owner_id: Optional[int] = None
+        cls,
+        session: AsyncSession,
+        obj_id: int,
+        owner_id: Optional[int] = None,
     ) -> int | None:
         """
         Delete a record from the database.
 
         Args:
+            session (AsyncSession): The session to run the query on.
             obj_id (int): The ID of the record to delete.
+
+        Returns:
+            The deleted record's ID, or None if no row matched.
         """
-        logger.debug("Starting delete record for model {model.__name__}")
+        logger.opt(lazy=True).debug(
+            "Starting delete record for model {model}",
+            model=lambda: cls.model.__name__,
+        )
 
-        async with async_session() as session:
-            query = (
-                delete(cls.model)
-                .where(cls.model.id == obj_id)
-                .where(cls.model.owner_id == owner_id)
-                .returning(cls.model.id)
-            )
-            result = await session.execute(query)
-            deleted_id = result.scalar_one_or_none()
-            await session.commit()
-            return deleted_id
+        model = cls.model
+        query = lambda_stmt(
+            lambda: delete(model)
+            .where(model.id == obj_id)
+            .where(model.owner_id == owner_id)
+        )
+        result = await session.execute(query)
+        return obj_id if result.rowcount else None
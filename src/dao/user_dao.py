@@ -3,13 +3,22 @@ User Data Access Object (DAO) module for interacting with user data in the
 database.
 """
 
+from typing import Optional
+
 from loguru import logger
-from sqlalchemy import or_, select
+from sqlalchemy import bindparam, select
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.ext.asyncio import AsyncSession
 
-from ..database import async_session
 from ..models import Base, DBUser
 from .base_dao import BaseDAO
 
+# Built once so asyncpg can reuse the same server-side prepared plan
+# for the login hot path.
+_by_username_stmt = select(DBUser).where(
+    DBUser.username == bindparam("username")
+)
+
 
 class UserDAO(BaseDAO[DBUser]):
     """
@@ -19,32 +28,54 @@ class UserDAO(BaseDAO[DBUser]):
 
     model = DBUser
 
+    @classmethod
+    async def get_by_username(
+        cls, session: AsyncSession, username: str
+    ) -> Optional[DBUser]:
+        """
+        Retrieve a user by username via the shared prepared statement.
+
+        Args:
+            session (AsyncSession): The session to run the query on.
+            username (str): The username to look up.
+
+        Returns:
+            The retrieved user, or None if no user matched.
+        """
+        logger.opt(lazy=True).debug(
+            "Starting get by username for model {model}",
+            model=lambda: cls.model.__name__,
+        )
+
+        result = await session.execute(
+            _by_username_stmt, {"username": username}
+        )
+        return result.scalar_one_or_none()
+
     @classmethod
     async def create_record(
-        cls, obj_data: dict[str, str]
+        cls, session: AsyncSession, obj_data: dict[str, str]
     ) -> Base | DBUser | None:
         """
         Create a new record in the database.
 
         Args:
+            session (AsyncSession): The session to run the query on.
             obj_data (dict): The data for creating a new record.
 
         Returns:
             The created record or None if user exist.
         """
-        logger.debug("Starting create record for model {model.__name__}")
-
-        async with async_session() as session:
-            query = select(cls.model).filter(
-                or_(
-                    DBUser.username == obj_data.get("username"),
-                    DBUser.email == obj_data.get("email"),
-                )
-            )
-            result = await session.execute(query)
-
-            exist_user = result.scalar_one_or_none()
-            if exist_user:
-                return None
-
-        return await super(UserDAO, cls).create_record(obj_data)
+        logger.opt(lazy=True).debug(
+            "Starting create record for model {model}",
+            model=lambda: cls.model.__name__,
+        )
+
+        query = (
+            pg_insert(cls.model)
+            .values(**obj_data)
+            .on_conflict_do_nothing()
+            .returning(cls.model)
+        )
+        result = await session.execute(query)
+        return result.scalar_one_or_none()
@@ -2,6 +2,6 @@
 Database connection and session management.
 """
 
-from .database import async_session
+from .database import async_session, get_session
 
-__all__ = ["async_session"]
+__all__ = ["async_session", "get_session"]
@@ -2,18 +2,47 @@
 This module configures and provides access to the asynchronous
 SQLAlchemy database session.
 
-It defines the database engine, session factory.
+It defines the database engine, session factory and the session
+dependency shared by all endpoints.
 """
 
+from typing import AsyncIterator
+
 from sqlalchemy.ext.asyncio import (
     AsyncSession,
     async_sessionmaker,
     create_async_engine,
 )
+from sqlalchemy.pool import NullPool
 
 from src.config import settings
 
-engine = create_async_engine(settings.database_url_async)
+if settings.use_pgbouncer:
+    # PgBouncer does the pooling; a second pool in the app only adds
+    # idle connections on top of it. Server-side prepared statements
+    # are unsafe behind its transaction pooling mode, so the cache is
+    # disabled as well.
+    engine = create_async_engine(
+        settings.database_url_async,
+        poolclass=NullPool,
+        query_cache_size=1200,
+        connect_args={"prepared_statement_cache_size": 0},
+    )
+else:
+    engine = create_async_engine(
+        settings.database_url_async,
+        pool_size=settings.db_pool_size,
+        max_overflow=settings.db_max_overflow,
+        pool_timeout=settings.db_pool_timeout,
+        pool_recycle=settings.db_pool_recycle,
+        pool_pre_ping=True,
+        query_cache_size=1200,
+        connect_args={
+            "prepared_statement_cache_size": (
+                settings.db_prepared_statement_cache_size
+            ),
+        },
+    )
 async_session = async_sessionmaker(
     engine,
     expire_on_commit=False,
@@ -21,3 +50,15 @@ async_session = async_sessionmaker(
     autocommit=False,
     class_=AsyncSession,
 )
+
+
+async def get_session() -> AsyncIterator[AsyncSession]:
+    """
+    FastAPI dependency providing one session per request.
+
+    All DAO calls made while handling a request share this session, so
+    the request pays for a single pool acquisition instead of one per
+    DAO call.
+    """
+    async with async_session() as session:
+        yield session
@@ -7,14 +7,22 @@ based on the settings defined in the `config` module.
 """
 
 import sys
+from contextlib import asynccontextmanager
 from pathlib import Path
+from typing import AsyncIterator
 
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
 from fastapi.staticfiles import StaticFiles
 from loguru import logger
+from sqlalchemy import select, text
 
+from . import schemas
 from .api.v1.routers import resume_router, user_router
+from .database.database import async_session, engine
+from .models import DBResume, DBUser
+from .services import ai_batcher
 
 logger.remove()
 
@@ -25,6 +33,9 @@ logger.add(
     "| <cyan>{name}</cyan>:<cyan>{function}</cyan>:<cyan>{line}</cyan> - "
     "<level>{message}</level>",
     level="INFO",
+    enqueue=True,
+    backtrace=False,
+    diagnose=False,
 )
 
 logs_dir = Path("logs")
@@ -41,7 +52,52 @@ logger.add(
 )
 
 PROJECT_NAME = "Resume app"
-app = FastAPI(title=PROJECT_NAME, redirect_slashes=False)
+
+
+async def warmup() -> None:
+    """
+    Pay the one-time costs up front so the first real request does not.
+
+    Creates the first pooled connection, seeds the compiled-statement
+    cache with the hot SELECT shapes and forces the response schemas to
+    finish building.
+    """
+    schemas.Resume.model_rebuild()
+    schemas.User.model_rebuild()
+
+    async with engine.connect() as connection:
+        await connection.execute(text("SELECT 1"))
+
+    async with async_session() as session:
+        await session.execute(select(DBUser).limit(0))
+        await session.execute(select(DBResume).limit(0))
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI) -> AsyncIterator[None]:
+    """
+    Application startup and shutdown.
+
+    Warms up the database engine and schemas, and runs the AI batcher's
+    background task for the lifetime of the app.
+    """
+    try:
+        await warmup()
+        logger.info("Warm-up finished.")
+    except Exception as error:  # noqa: BLE001 - the app can still serve
+        logger.warning(f"Warm-up failed, continuing cold: {error}")
+
+    ai_batcher.start()
+    yield
+    await ai_batcher.stop()
+
+
+app = FastAPI(
+    title=PROJECT_NAME,
+    redirect_slashes=False,
+    lifespan=lifespan,
+    default_response_class=ORJSONResponse,
+)
 
 origins = [
     "http://localhost:8000",
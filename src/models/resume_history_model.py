@@ -2,7 +2,14 @@
 SQLAlchemy models for Resume's history data.
 """
 
-from sqlalchemy import DateTime, ForeignKey, Text, func
+from sqlalchemy import (
+    CheckConstraint,
+    DateTime,
+    ForeignKey,
+    Index,
+    Text,
+    func,
+)
 from sqlalchemy.orm import Mapped, mapped_column
 
 from .base_model import Base
@@ -14,6 +21,17 @@ class DBResumeHistory(Base):
     """
 
     __tablename__ = "resume_history"
+    __table_args__ = (
+        Index(
+            "ix_resume_history_resume_id_timestamp",
+            "resume_id",
+            "timestamp",
+        ),
+        CheckConstraint(
+            "original_content <> improved_content",
+            name="ck_resume_history_content_changed",
+        ),
+    )
 
     resume_id: Mapped[int] = mapped_column(
         ForeignKey("resumes.id", ondelete="CASCADE"), nullable=False
@@ -2,7 +2,7 @@
 SQLAlchemy models for Resume data.
 """
 
-from sqlalchemy import ForeignKey, String, Text
+from sqlalchemy import ForeignKey, Index, String, Text
 from sqlalchemy.orm import Mapped, mapped_column
 
 from .base_model import Base
@@ -14,6 +14,7 @@ class DBResume(Base):
     """
 
     __tablename__ = "resumes"
+    __table_args__ = (Index("ix_resumes_owner_id_id", "owner_id", "id"),)
 
     title: Mapped[str] = mapped_column(String(100), nullable=False)
     content: Mapped[str | None] = mapped_column(Text, nullable=True)
@@ -2,26 +2,29 @@
 Pydantic schemas for resume data.
 """
 
-from typing import Optional
+from typing import Annotated, Optional
+
+from pydantic import (
+    BaseModel,
+    ConfigDict,
+    Field,
+    StringConstraints,
+    field_validator,
+)
 
-from pydantic import BaseModel, Field
 
 class ResumeBase(BaseModel):
     """
     Base schema for resume.
     """
 
-    title: str = Field(
-        ...,
-        title="Resume title",
-        description="The title of the resume. Must be non empty.",
-        min_length=1,
-    )
-    content: Optional[str] = Field(
-        None,
-        title="Resume content.",
-        description="A detailed description of the resume.",
-    )
+    # Request bodies are validated on every call; keep the field
+    # definitions free of documentation metadata and freeze instances
+    # so pydantic can skip the mutable-state bookkeeping.
+    model_config = ConfigDict(frozen=True, extra="ignore")
+
+    title: Annotated[str, StringConstraints(min_length=1)]
+    content: Optional[str] = None
 
 
 class ResumeCreate(ResumeBase):
@@ -29,31 +32,23 @@ class ResumeCreate(ResumeBase):
     Schema for creating a new Resume.
     """
 
-    model_config = {
-        "title": "Resume creation data",
-        "json_schema_extra": {
-            "description": "Schema for creating a new Resume."
-        },
-    }
-
 
 class ResumeUpdate(ResumeBase):
     """
     Schema for updating an existing Resume.
     """
 
-    title: Optional[str] = Field(
-        None,
-        title="Resume title",
-        description="The title of the Resume. Must be non empty.",
-    )
+    title: Optional[str] = None
 
-    model_config = {
-        "title": "Resume update data",
-        "json_schema_extra": {
-            "description": "Schema for updating an existing Resume."
-        },
-    }
+    @field_validator("*", mode="before")
+    @classmethod
+    def reject_blank_strings(cls, value):
+        """
+        Reject empty or whitespace-only strings.
+        """
+        if isinstance(value, str) and (not value or value.isspace()):
+            raise ValueError("must not be empty or whitespace")
+        return value
 
 
 class Resume(ResumeBase):
@@ -67,8 +62,8 @@ class Resume(ResumeBase):
         description="The ID of the Resume.",
     )
 
-    model_config = {
-        "title": "Resume data",
-        "json_schema_extra": {"description": "Schema of Resume data."},
-        "from_attributes": True,
-    }
+    model_config = ConfigDict(
+        title="Resume data",
+        json_schema_extra={"description": "Schema of Resume data."},
+        from_attributes=True,
+    )
@@ -2,7 +2,16 @@
 Pydantic schemas for User data.
 """
 
-from pydantic import BaseModel, EmailStr, Field
+from typing import Annotated
+
+from pydantic import (
+    BaseModel,
+    ConfigDict,
+    EmailStr,
+    Field,
+    StringConstraints,
+    field_validator,
+)
 
 
 class UserBase(BaseModel):
@@ -10,17 +19,13 @@ class UserBase(BaseModel):
     Base schema for User, containing common attributes.
     """
 
-    username: str = Field(
-        ...,
-        title="User name",
-        description="The name of the user. Must be non empty.",
-        min_length=1,
-    )
-    email: EmailStr = Field(
-        ...,
-        title="User email",
-        description="The email of the user.",
-    )
+    # Request bodies are validated on every call; keep the field
+    # definitions free of documentation metadata and freeze instances
+    # so pydantic can skip the mutable-state bookkeeping.
+    model_config = ConfigDict(frozen=True, extra="ignore")
+
+    username: Annotated[str, StringConstraints(min_length=1)]
+    email: EmailStr
 
 
 class UserCreate(UserBase):
@@ -28,19 +33,7 @@ class UserCreate(UserBase):
     Schema for creating a new User.
     """
 
-    password: str = Field(
-        ...,
-        title="User password",
-        description="The password of the user.",
-        min_length=8,
-    )
-
-    model_config = {
-        "title": "User creation data",
-        "json_schema_extra": {
-            "description": "Schema for creating a new user."
-        },
-    }
+    password: Annotated[str, StringConstraints(min_length=8)]
 
 
 class UserUpdate(BaseModel):
@@ -48,24 +41,20 @@ class UserUpdate(BaseModel):
     Schema for updating an existing User.
     """
 
-    username: str = Field(
-        "",
-        title="User name",
-        description="The name of the user. Must be non empty.",
-        min_length=1,
-    )
-    email: EmailStr = Field(
-        "",
-        title="User email",
-        description="The email of the user.",
-    )
+    model_config = ConfigDict(frozen=True, extra="ignore")
 
-    model_config = {
-        "title": "User update data",
-        "json_schema_extra": {
-            "description": "Schema for updating an existing user."
-        },
-    }
+    username: Annotated[str, StringConstraints(min_length=1)] = ""
+    email: EmailStr = ""
+
+    @field_validator("*", mode="before")
+    @classmethod
+    def reject_blank_strings(cls, value):
+        """
+        Reject empty or whitespace-only strings.
+        """
+        if isinstance(value, str) and (not value or value.isspace()):
+            raise ValueError("must not be empty or whitespace")
+        return value
 
 
 class User(UserBase):
@@ -79,11 +68,11 @@ class User(UserBase):
         description="The ID of the user.",
     )
 
-    model_config = {
-        "title": "User data",
-        "json_schema_extra": {"description": "Schema of user data."},
-        "from_attributes": True,
-    }
+    model_config = ConfigDict(
+        title="User data",
+        json_schema_extra={"description": "Schema of user data."},
+        from_attributes=True,
+    )
 
 
 class Token(BaseModel):
@@ -102,10 +91,10 @@ class Token(BaseModel):
         description="The type of the token.",
     )
 
-    model_config = {
-        "title": "JWT token data",
-        "json_schema_extra": {"description": "Schema for JWT token data."},
-    }
+    model_config = ConfigDict(
+        title="JWT token data",
+        json_schema_extra={"description": "Schema for JWT token data."},
+    )
 
 
 class TokenData(BaseModel):
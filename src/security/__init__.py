@@ -5,13 +5,21 @@ Security related functionalities, including authentication and authorization.
 from .auth import (
     create_access_token,
     get_current_user,
+    invalidate_user_cache,
+)
+from .password import (
+    hash_password,
+    hash_password_async,
+    verify_password,
+    verify_password_async,
 )
-from .password import hash_password, verify_password
 
 __all__ = [
     "get_current_user",
     "create_access_token",
-    "get_current_user",
+    "invalidate_user_cache",
     "hash_password",
+    "hash_password_async",
     "verify_password",
+    "verify_password_async",
 ]
@@ -2,19 +2,152 @@
 Authentication and authorization utilities using JWT.
 """
 
+import base64
+import binascii
+import hashlib
+import hmac
+import json
+import time
 from datetime import datetime, timedelta, timezone
 from typing import Any
 
+import jwt
 from fastapi import Depends, HTTPException, status
 from fastapi.security import OAuth2PasswordBearer
-from jose import JWTError, jwt
+from jwt.exceptions import InvalidTokenError
+from sqlalchemy.ext.asyncio import AsyncSession
 
 from ..config import settings
 from ..dao import UserDAO
+from ..database import get_session
 from ..schemas import User
 
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl="/v1/users/login")
 
+# Encoded once at import time; settings never change while the app runs,
+# and PyJWT would otherwise re-encode the key string on every call.
+_SIGNING_KEY = settings.secret_key.encode("utf-8")
+_ALGORITHMS = [settings.algorithm]
+
+_USER_CACHE_TTL = 30.0
+_USER_CACHE_MAX_SIZE = 10_000
+_user_cache: dict[int, tuple[float, User]] = {}
+
+_TOKEN_CACHE_TTL = 5.0
+_TOKEN_CACHE_MAX_SIZE = 10_000
+_token_cache: dict[str, tuple[float, int, User]] = {}
+
+
+def invalidate_user_cache(user_id: int) -> None:
+    """
+    Drop the cached user after a mutation, so the next authenticated
+    request reloads it from the database. The user's cached tokens are
+    evicted too; otherwise they would keep serving the stale user for
+    the rest of their TTL.
+
+    Args:
+        user_id (int): The ID of the user to evict.
+    """
+    _user_cache.pop(user_id, None)
+    stale_tokens = [
+        token
+        for token, (_, cached_user_id, _) in _token_cache.items()
+        if cached_user_id == user_id
+    ]
+    for token in stale_tokens:
+        _token_cache.pop(token, None)
+
+
+def _b64url_decode(segment: str) -> bytes:
+    """
+    Decode one base64url token segment, restoring stripped padding.
+
+    Args:
+        segment (str): The base64url-encoded segment.
+
+    Returns:
+        bytes: The decoded bytes.
+    """
+    return base64.urlsafe_b64decode(segment + "=" * (-len(segment) % 4))
+
+
+def _verify_hs256(token: str) -> dict[str, Any]:
+    """
+    Verify an HS256 token directly with hmac/hashlib.
+
+    HS256 verification is one OpenSSL-backed HMAC plus a constant-time
+    compare; going straight to the stdlib skips the per-call algorithm
+    lookup and option handling PyJWT performs for the general case.
+
+    Args:
+        token (str): The raw JWT token.
+
+    Returns:
+        dict: The verified payload.
+
+    Raises:
+        InvalidTokenError: If the token is malformed, signed with a
+            different algorithm, has a bad signature, is expired, or is
+            missing the exp or sub claims.
+    """
+    try:
+        header_b64, payload_b64, signature_b64 = token.split(".")
+        header = json.loads(_b64url_decode(header_b64))
+        signature = _b64url_decode(signature_b64)
+        signing_input = f"{header_b64}.{payload_b64}".encode("ascii")
+    except (ValueError, binascii.Error, UnicodeEncodeError) as error:
+        raise InvalidTokenError("Malformed token") from error
+
+    if not isinstance(header, dict) or header.get("alg") != "HS256":
+        raise InvalidTokenError("Unexpected algorithm")
+
+    expected = hmac.new(_SIGNING_KEY, signing_input, hashlib.sha256).digest()
+    if not hmac.compare_digest(expected, signature):
+        raise InvalidTokenError("Signature verification failed")
+
+    try:
+        payload = json.loads(_b64url_decode(payload_b64))
+    except (ValueError, binascii.Error) as error:
+        raise InvalidTokenError("Malformed payload") from error
+
+    if "exp" not in payload or "sub" not in payload:
+        raise InvalidTokenError("Missing required claim")
+
+    expires_at = payload["exp"]
+    if (
+        not isinstance(expires_at, (int, float))
+        or expires_at <= time.time()
+    ):
+        raise InvalidTokenError("Token expired")
+
+    return payload
+
+
+def _is_plainly_expired(token: str) -> bool:
+    """
+    Check the unverified exp claim of a token.
+
+    Expired tokens can be rejected from this alone - a forged exp would
+    only make a token *look* expired - without paying for the HMAC
+    verification, which matters when a client keeps retrying a stale
+    token. Anything malformed is left for jwt.decode to diagnose.
+
+    Args:
+        token (str): The raw JWT token.
+
+    Returns:
+        bool: True if the token's own exp claim lies in the past.
+    """
+    try:
+        _, payload_b64, _ = token.split(".")
+        payload = json.loads(_b64url_decode(payload_b64))
+        expires_at = payload["exp"]
+    except (ValueError, KeyError, TypeError, binascii.Error):
+        return False
+    return (
+        isinstance(expires_at, (int, float)) and expires_at <= time.time()
+    )
+
 
 def create_access_token(
     subject: str | Any, expires_delta: timedelta | None = None
@@ -39,17 +172,21 @@ def create_access_token(
 
     to_encode = {"exp": expires_at, "sub": str(subject)}
     encoded_jwt = jwt.encode(
-        to_encode, settings.secret_key, algorithm=settings.algorithm
+        to_encode, _SIGNING_KEY, algorithm=settings.algorithm
     )
     return encoded_jwt
 
 
-async def get_current_user(token: str = Depends(oauth2_scheme)) -> User:
+async def get_current_user(
+    token: str = Depends(oauth2_scheme),
+    session: AsyncSession = Depends(get_session),
+) -> User:
     """
     Get the current user from the JWT token.
 
     Args:
         token (str, optional): The JWT token.
+        session (AsyncSession): The request-scoped database session.
 
     Returns:
         User: The current user object.
@@ -62,23 +199,57 @@ async def get_current_user(token: str = Depends(oauth2_scheme)) -> User:
         detail="Could not validate credentials",
         headers={"WWW-Authenticate": "Bearer"},
     )
+
+    cached_token = _token_cache.get(token)
+    if cached_token is not None and cached_token[0] > time.time():
+        return cached_token[2]
+
+    if _is_plainly_expired(token):
+        raise credentials_exception
+
     try:
-        payload = jwt.decode(
-            token, settings.secret_key, algorithms=[settings.algorithm]
-        )
-        str_userid = payload.get("sub")
-        if str_userid is None or not str_userid.isnumeric():
-            raise credentials_exception
-        
-        userid = int(str_userid)
-
-        user = await UserDAO.get_records_or_record(
-            return_one=True, id=userid
-        )
-        if user is None:
-            raise credentials_exception
-
-        return User.model_validate(user)
-
-    except JWTError as e:
+        if settings.algorithm == "HS256":
+            payload = _verify_hs256(token)
+        else:
+            payload = jwt.decode(
+                token,
+                _SIGNING_KEY,
+                algorithms=_ALGORITHMS,
+                options={"require": ["exp", "sub"]},
+            )
+        try:
+            userid = int(payload.get("sub"))
+        except (TypeError, ValueError):
+            raise credentials_exception from None
+
+        cached = _user_cache.get(userid)
+        if cached is not None and cached[0] > time.monotonic():
+            validated_user = cached[1]
+        else:
+            user = await UserDAO.get_one(session, id=userid)
+            if user is None:
+                raise credentials_exception
+
+            validated_user = User.model_validate(user)
+            if len(_user_cache) >= _USER_CACHE_MAX_SIZE:
+                _user_cache.clear()
+            _user_cache[userid] = (
+                time.monotonic() + _USER_CACHE_TTL,
+                validated_user,
+            )
+
+        expires_at = payload.get("exp")
+        if isinstance(expires_at, (int, float)):
+            if len(_token_cache) >= _TOKEN_CACHE_MAX_SIZE:
+                _token_cache.clear()
+            # Never cache a token beyond its own expiry.
+            _token_cache[token] = (
+                min(expires_at, time.time() + _TOKEN_CACHE_TTL),
+                userid,
+                validated_user,
+            )
+
+        return validated_user
+
+    except InvalidTokenError as e:
         raise credentials_exception from e
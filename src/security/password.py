@@ -2,8 +2,18 @@
 Password hashing utilities using bcrypt.
 """
 
+import asyncio
+import os
+from concurrent.futures import ThreadPoolExecutor
+
 import bcrypt
 
+from ..config import settings
+
+# Bcrypt is CPU-bound by design; run it on a dedicated pool so it
+# neither blocks the event loop nor starves FastAPI's default threadpool.
+_executor = ThreadPoolExecutor(max_workers=os.cpu_count())
+
 
 def hash_password(password: str) -> str:
     """
@@ -15,7 +25,10 @@ def hash_password(password: str) -> str:
     Returns:
         str: The hashed password.
     """
-    hashed = bcrypt.hashpw(password.encode("utf-8"), bcrypt.gensalt())
+    hashed = bcrypt.hashpw(
+        password.encode("utf-8"),
+        bcrypt.gensalt(rounds=settings.bcrypt_rounds),
+    )
     return hashed.decode("utf-8")
 
 
@@ -33,3 +46,36 @@ def verify_password(plain_password: str, hashed_password: str) -> bool:
     return bcrypt.checkpw(
         plain_password.encode("utf-8"), hashed_password.encode("utf-8")
     )
+
+
+async def hash_password_async(password: str) -> str:
+    """
+    Hashes the password on the executor, off the event loop.
+
+    Args:
+        password (str): The password to hash.
+
+    Returns:
+        str: The hashed password.
+    """
+    return await asyncio.get_running_loop().run_in_executor(
+        _executor, hash_password, password
+    )
+
+
+async def verify_password_async(
+    plain_password: str, hashed_password: str
+) -> bool:
+    """
+    Verifies the password on the executor, off the event loop.
+
+    Args:
+        plain_password (str): The plain text password to verify.
+        hashed_password (str): The hashed password to compare against.
+
+    Returns:
+        bool: True if the passwords match, False otherwise.
+    """
+    return await asyncio.get_running_loop().run_in_executor(
+        _executor, verify_password, plain_password, hashed_password
+    )
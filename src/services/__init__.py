@@ -2,6 +2,7 @@
 Module for services of the application.
 """
 
+from .ai_batcher import ai_batcher
 from .ai_service import ai_service
 
-__all__ = ["ai_service"]
+__all__ = ["ai_service", "ai_batcher"]
@@ -0,0 +1,135 @@
+"""
+Micro-batching front for the AI service.
+
+Coalesces concurrent improve requests into one upstream call, so N
+requests arriving within the batch window cost roughly one provider
+round-trip instead of N.
+"""
+
+import asyncio
+from typing import Optional
+
+from loguru import logger
+
+from .ai_service import ai_service
+
+
+class AIBatcher:
+    """
+    Queue-backed coalescer in front of AIService.
+
+    Requests are queued together with a future; a background task drains
+    the queue every `batch_window` seconds (or as soon as
+    `max_batch_size` items are pending), sends them upstream as one
+    batch and fans the results back out.
+    """
+
+    def __init__(
+        self, batch_window: float = 0.01, max_batch_size: int = 16
+    ) -> None:
+        self.batch_window = batch_window
+        self.max_batch_size = max_batch_size
+        self._queue: asyncio.Queue[tuple[str, asyncio.Future]] = (
+            asyncio.Queue()
+        )
+        self._task: Optional[asyncio.Task] = None
+
+    def start(self) -> None:
+        """
+        Start the background batching task. Called from the application
+        lifespan.
+        """
+        if self._task is None:
+            self._task = asyncio.create_task(self._worker())
+            logger.debug("AI batcher started.")
+
+    async def stop(self) -> None:
+        """
+        Cancel the background batching task. Called from the application
+        lifespan.
+        """
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+            # Fail whatever was still queued; the callers would
+            # otherwise await their futures forever.
+            while not self._queue.empty():
+                _, future = self._queue.get_nowait()
+                if not future.done():
+                    future.set_exception(
+                        RuntimeError("AI batcher stopped")
+                    )
+            logger.debug("AI batcher stopped.")
+
+    async def improve(self, content: str) -> str:
+        """
+        Improve one piece of content through the shared batch.
+
+        Args:
+            content (str): Text for improvement.
+
+        Returns:
+            str: Text of improved content.
+        """
+        if self._task is None:
+            # No running batcher (scripts, tests): call straight through.
+            chunks = [
+                chunk
+                async for chunk in ai_service.improve_resume_content(
+                    original_content=content
+                )
+            ]
+            return "".join(chunks)
+
+        future: asyncio.Future = asyncio.get_running_loop().create_future()
+        await self._queue.put((content, future))
+        return await future
+
+    async def _worker(self) -> None:
+        loop = asyncio.get_running_loop()
+        while True:
+            batch = [await self._queue.get()]
+            deadline = loop.time() + self.batch_window
+            while len(batch) < self.max_batch_size:
+                timeout = deadline - loop.time()
+                if timeout <= 0:
+                    break
+                try:
+                    batch.append(
+                        await asyncio.wait_for(self._queue.get(), timeout)
+                    )
+                except asyncio.TimeoutError:
+                    break
+
+            contents = [content for content, _ in batch]
+            try:
+                results = await ai_service.improve_resume_content_batch(
+                    contents
+                )
+                # strict: a provider returning the wrong number of
+                # results must fail the batch, not leave the unmatched
+                # callers hanging.
+                paired = list(zip(batch, results, strict=True))
+            except asyncio.CancelledError:
+                for _, future in batch:
+                    if not future.done():
+                        future.set_exception(
+                            RuntimeError("AI batcher stopped")
+                        )
+                raise
+            except Exception as error:  # noqa: BLE001 - fan out to callers
+                for _, future in batch:
+                    if not future.done():
+                        future.set_exception(error)
+                continue
+
+            for (_, future), result in paired:
+                if not future.done():
+                    future.set_result(result)
+
+
+ai_batcher = AIBatcher()
@@ -2,24 +2,54 @@
 Module for AI improve.
 """
 
+from typing import AsyncIterator
+
 
 class AIService:
     """
     A service for interacting with AI models (or their stubs).
     """
 
-    async def improve_resume_content(self, original_content: str) -> str:
+    async def improve_resume_content(
+        self, original_content: str
+    ) -> AsyncIterator[str]:
         """
-        Accepts the original content, and returns an improved version.
+        Accepts the original content, and yields chunks of an improved
+        version. Real LLM providers stream their output; the stub
+        yields the whole improvement as a single chunk.
+
         Args:
             original_content (str): Text for improvement.
 
-        Returns:
-            str: Text of improved content
+        Yields:
+            str: Chunks of improved content.
+        """
+        yield f"{original_content} [Improved]"
+
+    async def improve_resume_content_batch(
+        self, contents: list[str]
+    ) -> list[str]:
         """
-        improved_content = f"{original_content} [Improved]"
+        Accepts a batch of contents and returns the improved versions,
+        in the same order. Real providers can serve the whole batch with
+        one upstream request; the stub improves each item in turn.
 
-        return improved_content
+        Args:
+            contents (list[str]): Texts for improvement.
+
+        Returns:
+            list[str]: Texts of improved contents.
+        """
+        results = []
+        for content in contents:
+            chunks = [
+                chunk
+                async for chunk in self.improve_resume_content(
+                    original_content=content
+                )
+            ]
+            results.append("".join(chunks))
+        return results
 
 
 ai_service = AIService()
@@ -5,4 +5,4 @@ set -e
 alembic upgrade head
 
 echo "Starting Uvicorn..."
-exec uvicorn src.main:app --host 0.0.0.0 --port 8000
\ No newline at end of file
+exec uvicorn src.main:app --host 0.0.0.0 --port 8000 --loop uvloop
\ No newline at end of file
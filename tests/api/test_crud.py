@@ -4,7 +4,8 @@ Module for testing crud
 
 import bcrypt
 import pytest
-from sqlalchemy import text
+from sqlalchemy import insert, select
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 from sqlalchemy.exc import SQLAlchemyError
 from sqlalchemy.ext.asyncio import AsyncSession
 
@@ -13,38 +14,54 @@ from src.dao import ResumeDAO
 from src.models import DBResume, DBUser
 from src.security import hash_password
 
+# Bcrypt costs ~100 ms per call by design; hash the shared test password
+# once instead of once per created user.
+_FIXED_HASH = hash_password("password")
 
-async def create_user_in_db(
+# Core Table objects; statements built on these are cacheable and
+# prepared by asyncpg, unlike raw text() strings.
+_USERS = DBUser.__table__
+_RESUMES = DBResume.__table__
+
+
+async def reset_and_create_user(
     get_db: AsyncSession,
     username: str,
     email: str,
 ) -> DBUser | None:
     """
-    Creates a new user in the database.
+    Creates the test user, resetting any leftover row with the same
+    username, in a single round-trip.
     Returns the created user object, or None if creation fails.
     """
     try:
-        result = await get_db.execute(
-            text(
-                "INSERT INTO users (username, email, hashed_password) "
-                "VALUES (:username, :email, :hashed_password) "
-                "RETURNING id, username, email, hashed_password"
-            ),
-            {
-                "username": username,
-                "email": email,
-                "hashed_password": hash_password("password"),
+        stmt = pg_insert(_USERS).values(
+            username=username,
+            email=email,
+            hashed_password=_FIXED_HASH,
+        )
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[_USERS.c.username],
+            set_={
+                "email": stmt.excluded.email,
+                "hashed_password": stmt.excluded.hashed_password,
             },
+        ).returning(
+            _USERS.c.id,
+            _USERS.c.username,
+            _USERS.c.email,
+            _USERS.c.hashed_password,
         )
+        result = await get_db.execute(stmt)
         await get_db.commit()
 
         row = result.first()
         if row:
             return DBUser(
-                id=row[0],
-                username=row[1],
-                email=row[2],
-                hashed_password=row[3],
+                id=row.id,
+                username=row.username,
+                email=row.email,
+                hashed_password=row.hashed_password,
             )
         return None
     except SQLAlchemyError:
@@ -52,28 +69,6 @@ async def create_user_in_db(
         return None
 
 
-async def delete_test_user_form_db(
-    get_db: AsyncSession, test_username: str
-) -> None:
-    """
-    Delete test user from database if exists.
-    """
-
-    result = await get_db.execute(
-        text("SELECT * FROM users WHERE username = :username"),
-        {"username": test_username},
-    )
-    user_exists = bool(result.scalar_one_or_none())
-
-    if user_exists:
-        await get_db.execute(
-            text("DELETE FROM users WHERE username = :username").params(
-                username=test_username
-            )
-        )
-        await get_db.commit()
-
-
 async def get_user_from_db(
     get_db: AsyncSession, test_username: str
 ) -> DBUser | None:
@@ -82,16 +77,20 @@ async def get_user_from_db(
     """
 
     result = await get_db.execute(
-        text(
-            "SELECT id, username, email, hashed_password "
-            "FROM users WHERE username = :username"
-        ),
-        {"username": test_username},
+        select(
+            _USERS.c.id,
+            _USERS.c.username,
+            _USERS.c.email,
+            _USERS.c.hashed_password,
+        ).where(_USERS.c.username == test_username)
     )
     row = result.first()
     if row:
         return DBUser(
-            id=row[0], username=row[1], email=row[2], hashed_password=row[3]
+            id=row.id,
+            username=row.username,
+            email=row.email,
+            hashed_password=row.hashed_password,
         )
     return None
 
@@ -109,27 +108,24 @@ async def create_resume_in_db(
     """
     try:
         result = await get_db.execute(
-            text(
-                "INSERT INTO resumes (title, content, owner_id) "
-                "VALUES (:title, :content, :owner_id) "
-                "RETURNING id, title, content, owner_id"
-            ),
-            {
-                "title": title,
-                "content": content,
-                "owner_id": owner_id,
-            },
+            insert(_RESUMES)
+            .values(title=title, content=content, owner_id=owner_id)
+            .returning(
+                _RESUMES.c.id,
+                _RESUMES.c.title,
+                _RESUMES.c.content,
+                _RESUMES.c.owner_id,
+            )
         )
         await get_db.commit()
 
         row = result.first()
         if row:
             return DBResume(
-                id=row[0],
-                title=row[1],
-                content=row[2],
-                owner_id=row[3],
-                
+                id=row.id,
+                title=row.title,
+                content=row.content,
+                owner_id=row.owner_id,
             )
         return None
 
@@ -148,19 +144,20 @@ async def get_resume_from_db(
     """
 
     result = await get_db.execute(
-        text(
-            "SELECT id, title, content, owner_id "
-            "FROM resumes WHERE id = :id"
-        ),
-        {"id": resume_id},
+        select(
+            _RESUMES.c.id,
+            _RESUMES.c.title,
+            _RESUMES.c.content,
+            _RESUMES.c.owner_id,
+        ).where(_RESUMES.c.id == resume_id)
     )
     row = result.first()
     if row:
         return DBResume(
-            id=row[0],
-            title=row[1],
-            content=row[2],
-            owner_id=row[3],
+            id=row.id,
+            title=row.title,
+            content=row.content,
+            owner_id=row.owner_id,
         )
     return None
 
@@ -186,16 +183,15 @@ async def test_create_user(get_db: AsyncSession):
     test_username = "testuser"
     test_email = "test@example.com"
 
-    await delete_test_user_form_db(get_db=get_db, test_username=test_username)
-
     data = {
         "username": test_username,
         "email": test_email,
-        "hashed_password": hash_password("password123"),
+        "hashed_password": _FIXED_HASH,
     }
 
-    user = await UserDAO.create_record(obj_data=data)
+    user = await UserDAO.create_record(get_db, obj_data=data)
     assert user is not None
+    await get_db.commit()
 
     retrieved_user = await get_user_from_db(
         get_db=get_db, test_username=test_username
@@ -213,15 +209,12 @@ async def test_get_user(get_db: AsyncSession):
     test_username = "testuser"
     test_email = "test@example.com"
 
-    await delete_test_user_form_db(get_db=get_db, test_username=test_username)
-    user = await create_user_in_db(
+    user = await reset_and_create_user(
         get_db=get_db, username=test_username, email=test_email
     )
     assert user is not None
 
-    retrieved_user = await UserDAO.get_records_or_record(
-        return_one=True, id=user.id
-    )
+    retrieved_user = await UserDAO.get_one(get_db, id=user.id)
     assert retrieved_user is not None
     assert isinstance(retrieved_user, DBUser)
     assert retrieved_user.username == test_username
@@ -236,15 +229,12 @@ async def test_get_user_by_username(get_db: AsyncSession):
     test_username = "testuser"
     test_email = "test@example.com"
 
-    await delete_test_user_form_db(get_db=get_db, test_username=test_username)
-    user = await create_user_in_db(
+    user = await reset_and_create_user(
         get_db=get_db, username=test_username, email=test_email
     )
     assert user is not None
 
-    retrieved_user = await UserDAO.get_records_or_record(
-        return_one=True, username=test_username
-    )
+    retrieved_user = await UserDAO.get_one(get_db, username=test_username)
     assert retrieved_user is not None
     assert isinstance(retrieved_user, DBUser)
     assert retrieved_user.username == test_username
@@ -261,19 +251,17 @@ async def test_get_users(get_db: AsyncSession):
     test_username2 = "testuser2"
     test_email2 = "test2@example.com"
 
-    await delete_test_user_form_db(get_db=get_db, test_username=test_username1)
-    await delete_test_user_form_db(get_db=get_db, test_username=test_username2)
-    user1 = await create_user_in_db(
+    user1 = await reset_and_create_user(
         get_db=get_db, username=test_username1, email=test_email1
     )
     assert user1 is not None
 
-    user2 = await create_user_in_db(
+    user2 = await reset_and_create_user(
         get_db=get_db, username=test_username2, email=test_email2
     )
     assert user2 is not None
 
-    users = await UserDAO.get_records_or_record()
+    users = await UserDAO.get_many(get_db)
     assert users is not None
     assert isinstance(users, list)
     assert any(user.username == test_username1 for user in users)
@@ -290,11 +278,7 @@ async def test_update_user(get_db: AsyncSession):
     updated_username = "newuser"
     updated_email = "new@example.com"
 
-    await delete_test_user_form_db(get_db=get_db, test_username=test_username)
-    await delete_test_user_form_db(
-        get_db=get_db, test_username=updated_username
-    )
-    user = await create_user_in_db(
+    user = await reset_and_create_user(
         get_db=get_db, username=test_username, email=test_email
     )
     assert user is not None
@@ -302,9 +286,10 @@ async def test_update_user(get_db: AsyncSession):
     user_update = {"username": updated_username, "email": updated_email}
 
     updated_user = await UserDAO.update_record(
-        obj_id=user.id, obj_data=user_update
+        get_db, obj_id=user.id, obj_data=user_update
     )
     assert updated_user is not None
+    await get_db.commit()
     assert updated_user.username == updated_username
     assert updated_user.email == updated_email
 
@@ -322,13 +307,13 @@ async def test_delete_user(get_db: AsyncSession):
     test_username = "testuser"
     test_email = "test@example.com"
 
-    await delete_test_user_form_db(get_db=get_db, test_username=test_username)
-    user = await create_user_in_db(
+    user = await reset_and_create_user(
         get_db=get_db, username=test_username, email=test_email
     )
     assert user is not None
 
-    await UserDAO.delete_record(obj_id=user.id)
+    await UserDAO.delete_record(get_db, obj_id=user.id)
+    await get_db.commit()
     retrieved_user = await get_user_from_db(get_db, test_username)
     assert retrieved_user is None
 
@@ -343,8 +328,7 @@ async def test_create_resume(get_db: AsyncSession):
     test_resume_title = "testresume"
     test_resume_content = "testcontent"
 
-    await delete_test_user_form_db(get_db=get_db, test_username=test_username)
-    user = await create_user_in_db(
+    user = await reset_and_create_user(
         get_db=get_db, username=test_username, email=test_email
     )
     assert user is not None
@@ -355,8 +339,9 @@ async def test_create_resume(get_db: AsyncSession):
         "owner_id": user.id,
     }
 
-    resume = await ResumeDAO.create_record(obj_data=resume_create)
+    resume = await ResumeDAO.create_record(get_db, obj_data=resume_create)
     assert resume is not None
+    await get_db.commit()
 
     retrieved_resume = await get_resume_from_db(get_db, resume.id)
     assert retrieved_resume is not None
@@ -374,8 +359,7 @@ async def test_get_resume(get_db: AsyncSession):
     test_resume_title = "testresume"
     test_resume_content = "testcontent"
 
-    await delete_test_user_form_db(get_db=get_db, test_username=test_username)
-    user = await create_user_in_db(
+    user = await reset_and_create_user(
         get_db=get_db, username=test_username, email=test_email
     )
     assert user is not None
@@ -388,9 +372,7 @@ async def test_get_resume(get_db: AsyncSession):
     )
     assert resume is not None
 
-    retrieved_resume = await ResumeDAO.get_records_or_record(
-        return_one=True, id=resume.id
-    )
+    retrieved_resume = await ResumeDAO.get_one(get_db, id=resume.id)
     assert retrieved_resume is not None
     assert isinstance(retrieved_resume, DBResume)
     assert retrieved_resume.title == test_resume_title
@@ -409,8 +391,7 @@ async def test_get_resumes(get_db: AsyncSession):
     test_resume_title2 = "testresume2"
     test_resume_content2 = "testcontent2"
 
-    await delete_test_user_form_db(get_db=get_db, test_username=test_username)
-    user = await create_user_in_db(
+    user = await reset_and_create_user(
         get_db=get_db, username=test_username, email=test_email
     )
     assert user is not None
@@ -431,7 +412,7 @@ async def test_get_resumes(get_db: AsyncSession):
     )
     assert resume2 is not None
 
-    resumes = await ResumeDAO.get_records_or_record(owner_id=user.id)
+    resumes = await ResumeDAO.get_many(get_db, owner_id=user.id)
     assert resumes is not None
     assert isinstance(resumes, list)
     assert any(resume.title == test_resume_title1 for resume in resumes)
@@ -450,8 +431,7 @@ async def test_update_resume(get_db: AsyncSession):
     updated_resume_title = "newtitle"
     updated_resume_content = "newcontent"
 
-    await delete_test_user_form_db(get_db=get_db, test_username=test_username)
-    user = await create_user_in_db(
+    user = await reset_and_create_user(
         get_db=get_db, username=test_username, email=test_email
     )
     assert user is not None
@@ -470,9 +450,10 @@ async def test_update_resume(get_db: AsyncSession):
     }
 
     updated_resume = await ResumeDAO.update_record(
-        obj_id=resume.id, obj_data=resume_update, owner_id=user.id
+        get_db, obj_id=resume.id, obj_data=resume_update, owner_id=user.id
     )
     assert updated_resume is not None
+    await get_db.commit()
     assert updated_resume.title == updated_resume_title
     assert updated_resume.content == updated_resume_content
 
@@ -492,8 +473,7 @@ async def test_delete_resume(get_db: AsyncSession):
     test_resume_title = "testresume"
     test_resume_content = "testcontent"
 
-    await delete_test_user_form_db(get_db=get_db, test_username=test_username)
-    user = await create_user_in_db(
+    user = await reset_and_create_user(
         get_db=get_db, username=test_username, email=test_email
     )
     assert user is not None
@@ -506,8 +486,11 @@ async def test_delete_resume(get_db: AsyncSession):
     )
     assert resume is not None
 
-    deleted_id = await ResumeDAO.delete_record(obj_id=resume.id, owner_id=user.id)
+    deleted_id = await ResumeDAO.delete_record(
+        get_db, obj_id=resume.id, owner_id=user.id
+    )
     assert deleted_id is not None
+    await get_db.commit()
     assert deleted_id == resume.id
     retrieved_resume = await get_resume_from_db(get_db, resume.id)
     assert retrieved_resume is None
@@ -7,7 +7,9 @@ from typing import AsyncGenerator, Generator
 
 import pytest
 import pytest_asyncio
+import uvloop
 from sqlalchemy.ext.asyncio import (
+    AsyncEngine,
     AsyncSession,
     async_sessionmaker,
     create_async_engine,
@@ -19,6 +21,10 @@ from src.config import settings
 
 ALEMBIC_CONFIG_PATH = "alembic.ini"
 
+# Run the tests on the same event loop implementation uvicorn uses in
+# production.
+uvloop.install()
+
 
 def run_migrations() -> None:
     """
@@ -47,22 +53,52 @@ def prepare_database() -> Generator[None, None, None]:
     downgrade_migrations()
 
 
-@pytest_asyncio.fixture(scope="session")
-async def get_db() -> AsyncGenerator[AsyncSession, None]:
+@pytest_asyncio.fixture(scope="session", loop_scope="session")
+async def _engine() -> AsyncGenerator[AsyncEngine, None]:
     """
-    Create a test database session for each test.
+    Create one engine for the whole test session.
+
+    A small pool is plenty for the sequential test run, and disposing
+    the engine at the end closes the connections cleanly instead of
+    leaking them until interpreter shutdown. The pooled asyncpg
+    connections are bound to the loop they were created on, so the
+    engine is pinned to the session loop explicitly - everything that
+    touches it must run there.
     """
-    engine = create_async_engine(settings.database_url_async)
-    async_session = async_sessionmaker(
-        engine,
-        expire_on_commit=False,
-        autoflush=False,
-        autocommit=False,
-        class_=AsyncSession,
+    engine = create_async_engine(
+        settings.database_url_async,
+        pool_size=5,
+        max_overflow=0,
     )
+    yield engine
+    await engine.dispose()
 
-    async with async_session() as session:
-        yield session
+
+@pytest_asyncio.fixture(loop_scope="session")
+async def get_db(_engine: AsyncEngine) -> AsyncGenerator[AsyncSession, None]:
+    """
+    Create a test database session for each test.
+
+    The session joins an outer transaction on a dedicated connection
+    and commits into savepoints, so everything a test writes — commits
+    included — is rolled back on teardown. Tests stay isolated without
+    any cleanup DELETEs.
+    """
+    async with _engine.connect() as connection:
+        transaction = await connection.begin()
+        async_session = async_sessionmaker(
+            connection,
+            expire_on_commit=False,
+            autoflush=False,
+            autocommit=False,
+            class_=AsyncSession,
+            join_transaction_mode="create_savepoint",
+        )
+
+        async with async_session() as session:
+            yield session
+
+        await transaction.rollback()
 
 
 @pytest.fixture(scope="session")